@@ -1,118 +1,132 @@
-"""
-Manages and displays time within the simulation and updates relevant parts of the simulation.
-
-Imports:
-    time
-    pygame
-    display: Manages display properties and pygame modules for handling the display.
-    population: Manages general methods relevant to the whole population. Also calls for people to be initialised.
-    plot_graph: Manages the display of simulation data in graph form.
-
-Classes:
-    Clock
-"""
-
-import time
-import pygame
-import display # For typing
-import population # For typing
-import plot_graph
-
-class Clock:
-    """
-    A class to manage and display time within a simulation.
-
-    Attributes:
-        __day (int): The current day of the simulation.
-        __hour (int): The current hour of the simulation.
-        __running (bool): The state of the simulation (running or not).
-        __seconds_per_hour (float): The number of real-world seconds per simulation hour.
-        __fps (int): The frames per second for the simulation display.
-        __font (pygame.font.Font): The font used to display time.
-        __display (display.Display): The display surface for the simulation.
-        __population (population.Population): The population being simulated.
-        __last_update (float): The last time the simulation was updated.
-        __graph (plot_graph.PlotGraph): The graph to display simulation data.
-    """
-    def __init__(self, display_obj: display.Display,
-                 population_obj: population.Population,
-                 seconds_per_hour: float, fps: int) -> None:
-        """
-        Initialises the Clock class with the given parameters.
-
-        Args:
-            display_obj (display.Display): The display surface for the simulation.
-            population_obj (population.Population): The population being simulated.
-            seconds_per_hour (int): The number of real-world seconds per simulation hour.
-            fps (int): The frames per second for the simulation display.
-        """
-        self.__day: int = 1
-        self.__hour: int = 0
-        self.__running: bool = True
-        self.__seconds_per_hour: float = seconds_per_hour
-        self.__fps: int = fps
-        pygame.font.init()
-        self.__font: pygame.font.Font = pygame.font.SysFont('Arial Bold', 25)
-        self.__display: display.Display = display_obj
-        self.__population: population.Population = population_obj
-        self.__last_update: float = time.time()
-        self.__graph: plot_graph.PlotGraph = plot_graph.PlotGraph(self.__display.get_caption(), self.__fps)
-        self.__graph.update(self.__day, self.__hour, self.__population.get_status_counts())
-
-    def update_time(self) -> None:
-        """
-        Updates the time within the simulation. Stops the simulation if there are no active infections.
-        """
-        if not self.__running: # Stop if not running
-            return
-
-        if not self.__population.has_active_infections(): # If no infections, update graph and stop running
-            self.__population.update_infection_status()
-            counts = self.__population.get_status_counts()
-            self.__graph.update(self.__day, self.__hour, counts)
-            self.__running = False
-            return
-
-        current_time: float = time.time()
-
-        # If a simulation hour has passed
-        if current_time - self.__last_update >= self.__seconds_per_hour:
-            self.__hour += 1 # Increment simulation hour
-            self.__population.update_infection_status() # Update infections
-
-            counts = self.__population.get_status_counts()
-            self.__graph.update(self.__day, self.__hour, counts) # Update graph with current population status
-
-            if self.__hour > 24: # Change day
-                self.__hour = 1
-                self.__day += 1
-
-            # People to reach office by hour 9 and leave by hour 17
-            for individual in self.__population.get_people():
-                if self.__hour == individual.get_leave_home():
-                    individual.start_move_to_office()
-                elif self.__hour == 17:
-                    individual.start_move_to_home()
-
-            self.__last_update = current_time
-
-    def display_time(self) -> None:
-        """
-        Displays the current time on the simulation display.
-        """
-        if self.__running:
-            time_text: str = f"Day: {self.__day}, Hour: {self.__hour}"
-        else:
-            time_text: str = "Simulation Ended"
-
-        text_surface: display.Display = self.__font.render(time_text, True, (0, 0, 0))
-        self.__display.get_screen().blit(text_surface, (10, 10))
-
-    def get_running(self) -> bool:
-        """
-        Gets the running state of the simulation.
-
-        Returns:
-            bool: True if the simulation is running, False otherwise.
-        """
-        return self.__running
+"""
+Manages and displays time within the simulation and updates relevant parts of the simulation.
+
+Imports:
+    pygame
+    display: Manages display properties and pygame modules for handling the display.
+    population: Manages general methods relevant to the whole population. Also calls for people to be initialised.
+    plot_graph: Manages the display of simulation data in graph form.
+
+Classes:
+    Clock
+"""
+
+import pygame
+import display # For typing
+import population # For typing
+import plot_graph
+
+class Clock:
+    """
+    A class to manage and display time within a simulation.
+
+    Attributes:
+        __day (int): The current day of the simulation.
+        __hour (int): The current hour of the simulation.
+        __running (bool): The state of the simulation (running or not).
+        __seconds_per_hour (float): The number of real-world seconds per simulation hour.
+        __ms_per_hour (int): The number of real-world milliseconds per simulation hour.
+        __font (pygame.font.Font): The font used to display time.
+        __display (display.Display): The display surface for the simulation.
+        __population (population.Population): The population being simulated.
+        __last_update (int): The tick count (ms) at which the simulation was last updated.
+        __graph (plot_graph.PlotGraph): The graph to display simulation data.
+        __time_surface (pygame.Surface): The cached rendered time text.
+        __time_surface_key (tuple[int, int, bool]): The (day, hour, running) state the cache was rendered for.
+    """
+
+    __slots__ = ('__day', '__hour', '__running', '__seconds_per_hour', '__ms_per_hour', '__font',
+                 '__display', '__population', '__last_update', '__time_surface',
+                 '__time_surface_key', '__graph')
+
+    def __init__(self, display_obj: display.Display,
+                 population_obj: population.Population,
+                 seconds_per_hour: float) -> None:
+        """
+        Initialises the Clock class with the given parameters.
+
+        Args:
+            display_obj (display.Display): The display surface for the simulation.
+            population_obj (population.Population): The population being simulated.
+            seconds_per_hour (int): The number of real-world seconds per simulation hour.
+        """
+        self.__day: int = 1
+        self.__hour: int = 0
+        self.__running: bool = True
+        self.__seconds_per_hour: float = seconds_per_hour
+        self.__ms_per_hour: int = int(seconds_per_hour * 1000)
+        pygame.font.init()
+        self.__font: pygame.font.Font = pygame.font.SysFont('Arial Bold', 25)
+        self.__display: display.Display = display_obj
+        self.__population: population.Population = population_obj
+        self.__last_update: int = pygame.time.get_ticks()
+        self.__time_surface: pygame.Surface = None
+        self.__time_surface_key: tuple[int, int, bool] = None
+        self.__graph: plot_graph.PlotGraph = plot_graph.PlotGraph(self.__display.get_caption())
+        self.__graph.update(self.__day, self.__hour, self.__population.get_status_counts())
+
+    def update_time(self) -> None:
+        """
+        Updates the time within the simulation. Stops the simulation if there are no active infections.
+        """
+        if not self.__running: # Stop if not running
+            return
+
+        if not self.__population.has_active_infections(): # If no infections, update graph and stop running
+            self.__population.update_infection_status()
+            counts = self.__population.get_status_counts()
+            self.__graph.update(self.__day, self.__hour, counts)
+            self.__running = False
+            return
+
+        current_time: int = pygame.time.get_ticks()
+
+        # If a simulation hour has passed (integer ms avoids float time arithmetic every frame)
+        if current_time - self.__last_update >= self.__ms_per_hour:
+            self.__hour += 1 # Increment simulation hour
+            self.__population.update_infection_status() # Update infections
+
+            counts = self.__population.get_status_counts()
+            self.__graph.update(self.__day, self.__hour, counts) # Update graph with current population status
+
+            if self.__hour > 24: # Change day
+                self.__hour = 1
+                self.__day += 1
+
+            # People to reach office by hour 9 and leave by hour 17
+            for individual in self.__population.get_people_leaving_at(self.__hour):
+                individual.start_move_to_office()
+            if self.__hour == 17:
+                self.__population.move_to_homes()
+
+            self.__last_update = current_time
+
+    def display_time(self) -> pygame.Rect:
+        """
+        Displays the current time on the simulation display.
+
+        Returns:
+            pygame.Rect: The screen area the time text covers.
+        """
+        key: tuple[int, int, bool] = (self.__day, self.__hour, self.__running)
+
+        # Only re-render the text when the displayed time actually changes
+        if key != self.__time_surface_key:
+            if self.__running:
+                time_text: str = f"Day: {self.__day}, Hour: {self.__hour}"
+            else:
+                time_text: str = "Simulation Ended"
+
+            self.__time_surface = self.__font.render(time_text, True, (0, 0, 0))
+            self.__time_surface_key = key
+
+        return self.__display.get_screen().blit(self.__time_surface, (10, 10))
+
+    def get_running(self) -> bool:
+        """
+        Gets the running state of the simulation.
+
+        Returns:
+            bool: True if the simulation is running, False otherwise.
+        """
+        return self.__running
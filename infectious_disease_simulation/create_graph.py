@@ -1,53 +1,124 @@
-"""
-Defines CreateGraph class which creates a graph as an adjacency list from a 2D array.
-
-Imports:
-    numpy
-
-Classes:
-    CreateGraph
-"""
-import numpy as np
-
-class CreateGraph:
-    """
-    A class to create a graph as an adjacency list from a 2D array (the map).
-
-    Attributes:
-        __map (np.ndarray): A 2D array representing the tilemap.
-    """
-    def __init__(self, map_array: np.ndarray) -> None:
-        """
-        Initialises the CreateGraph class with the given map.
-
-        Args:
-            map_array (np.ndarray): A 2D array representing the tilemap.
-        """
-        self.__map: np.ndarray = map_array
-
-    def make_graph(self) -> dict[tuple[int, int], list[tuple[int, int]]]:
-        """
-        Creates a graph where each building is a node and edges exist between all pairs of nodes.
-
-        Returns:
-            dict[tuple[int, int],
-                 list[tuple[int, int]]]: Dictionary representing graph.
-                                         Keys are nodes, and values are lists of neighbouring nodes.
-        """
-        rows: int = len(self.__map)
-        columns: int = len(self.__map[0])
-        graph: dict[tuple[int, int], list[tuple[int, int]]] = {}
-        points: list[tuple[int, int]] = []
-
-        for i in range(rows):
-            for j in range(columns):
-                if self.__map[i][j] != 0:
-                    points.append((i, j)) # Add coordinates to points list if tile is a building (non-zero)
-
-        for point in points:
-            graph[point] = []
-            for other_point in points:
-                if point != other_point: # Avoid self loops
-                    graph[point].append(other_point) # Add points to graph
-
-        return graph
+"""
+Defines CreateGraph class which creates a graph as an adjacency list from a 2D array.
+
+Imports:
+    numpy
+
+Classes:
+    CreateGraph
+"""
+import numpy as np
+
+class CreateGraph:
+    """
+    A class to create a graph as an adjacency list from a 2D array (the map).
+
+    Attributes:
+        __map (np.ndarray): A 2D array representing the tilemap.
+    """
+    def __init__(self, map_array: np.ndarray) -> None:
+        """
+        Initialises the CreateGraph class with the given map.
+
+        Args:
+            map_array (np.ndarray): A 2D array representing the tilemap.
+        """
+        self.__map: np.ndarray = map_array
+
+    def make_graph(self, k: int = 8) -> dict[tuple[int, int], list[tuple[int, int]]]:
+        """
+        Creates a graph where each building is a node with edges to its k nearest neighbours.
+
+        A complete graph over P buildings has O(P^2) edges, which dominates the edge sorting and
+        pathfinding that follow. Connecting each building to its k nearest neighbours keeps the
+        graph at O(P*k) edges; extra edges are added between the closest buildings of any
+        disconnected components so the graph always stays connected.
+
+        Args:
+            k (int): The number of nearest neighbours to connect each node to. Defaults to 8.
+
+        Returns:
+            dict[tuple[int, int],
+                 list[tuple[int, int]]]: Dictionary representing graph.
+                                         Keys are nodes, and values are lists of neighbouring nodes.
+        """
+        # Find building (non-zero) tiles in one C-level pass instead of scanning cell by cell
+        pts: np.ndarray = np.argwhere(self.__map != 0)
+        points: list[tuple[int, int]] = [(int(i), int(j)) for i, j in pts]
+        num_points: int = len(points)
+
+        if num_points <= k + 1: # Few enough points that the k-NN graph is the complete graph
+            return {point: [other for other in points if other != point] for point in points}
+
+        # Pairwise squared distances computed with broadcasting (ordering is the same as for distances)
+        deltas: np.ndarray = pts[:, None, :] - pts[None, :, :]
+        sq_distances: np.ndarray = (deltas ** 2).sum(axis=2)
+        np.fill_diagonal(sq_distances, np.iinfo(sq_distances.dtype).max) # Exclude self loops
+
+        # Indices of each point's k nearest neighbours (argpartition avoids a full sort)
+        nearest: np.ndarray = np.argpartition(sq_distances, k, axis=1)[:, :k]
+
+        # Build a symmetric adjacency list: if a is a neighbour of b, b is a neighbour of a
+        neighbour_sets: list[set[int]] = [set() for _ in range(num_points)]
+        for i in range(num_points):
+            for j in nearest[i]:
+                neighbour_sets[i].add(int(j))
+                neighbour_sets[int(j)].add(i)
+
+        self.__connect_components(neighbour_sets, sq_distances)
+
+        return {points[i]: [points[j] for j in sorted(neighbour_sets[i])] for i in range(num_points)}
+
+    def __connect_components(self, neighbour_sets: list[set[int]], sq_distances: np.ndarray) -> None:
+        """
+        Connects any disconnected components of the k-NN graph by their closest pair of points.
+
+        Args:
+            neighbour_sets (list[set[int]]): The adjacency sets of the graph, updated in place.
+            sq_distances (np.ndarray): The matrix of pairwise squared distances between points.
+        """
+        num_points: int = len(neighbour_sets)
+        component: list[int] = self.__label_components(neighbour_sets)
+
+        while len(set(component)) > 1:
+            # Mask out distances within the same component, then link the closest cross-component pair
+            labels: np.ndarray = np.array(component)
+            masked: np.ndarray = np.where(labels[:, None] != labels[None, :],
+                                          sq_distances,
+                                          np.iinfo(sq_distances.dtype).max)
+            i, j = np.unravel_index(np.argmin(masked), masked.shape)
+            neighbour_sets[int(i)].add(int(j))
+            neighbour_sets[int(j)].add(int(i))
+
+            # Merge the two components under one label
+            merged_label: int = component[int(i)]
+            old_label: int = component[int(j)]
+            for index in range(num_points):
+                if component[index] == old_label:
+                    component[index] = merged_label
+
+    def __label_components(self, neighbour_sets: list[set[int]]) -> list[int]:
+        """
+        Labels each point with the component it belongs to using a breadth-first sweep.
+
+        Args:
+            neighbour_sets (list[set[int]]): The adjacency sets of the graph.
+
+        Returns:
+            list[int]: The component label of each point.
+        """
+        num_points: int = len(neighbour_sets)
+        component: list[int] = [-1] * num_points
+
+        for start in range(num_points):
+            if component[start] == -1: # Unvisited point starts a new component
+                component[start] = start
+                frontier: list[int] = [start]
+                while frontier:
+                    node: int = frontier.pop()
+                    for neighbour in neighbour_sets[node]:
+                        if component[neighbour] == -1:
+                            component[neighbour] = start
+                            frontier.append(neighbour)
+
+        return component
@@ -1,77 +1,102 @@
-"""
-Defines the Disease class to model the spread, recovery, and mortality of an infectious disease.
-
-Imports:
-    random
-
-Classes:
-    Disease
-"""
-
-import random
-
-class Disease:
-    """
-    A class to model the spread, recovery, and mortality of an infectious disease.
-
-    Attributes:
-        __seconds_per_hour (float): The number of seconds per simulation hour.
-        __infection_rate (float): The rate of infection per hour.
-        __incubation_time (float): The incubation time of the disease in real seconds.
-        __recovery_rate (float): The rate of recovery per hour.
-        __mortality_rate (float): The rate of mortality per hour.
-    """
-    def __init__(self, infection_rate: float, incubation_time: float,
-                 recovery_rate: float, mortality_rate: float,
-                 seconds_per_hour: float) -> None:
-        """
-        Initialises the Disease class with the given parameters.
-
-        Args:
-            infection_rate (float): The rate of infection per day.
-            incubation_time (float): The incubation time in days.
-            recovery_rate (float): The rate of recovery per day.
-            mortality_rate (float): The rate of mortality per day.
-            seconds_per_hour (float): The number of seconds per simulation hour.
-        """
-        self.__seconds_per_hour: float = seconds_per_hour
-        self.__infection_rate: float = infection_rate / 24
-        self.__incubation_time: float = incubation_time * 24 * self.__seconds_per_hour
-        self.__recovery_rate: float = recovery_rate / 24
-        self.__mortality_rate: float = mortality_rate / 24
-
-    def infect(self) -> bool:
-        """
-        Simulates whether an infection occurs based on the infection rate.
-
-        Returns:
-            bool: True if infection occurs, False otherwise.
-        """
-        return random.randint(0, 1000) < self.__infection_rate * 1000
-
-    def recover(self) -> bool:
-        """
-        Simulates whether recovery occurs based on the recovery rate.
-
-        Returns:
-            bool: True if recovery occurs, False otherwise.
-        """
-        return random.randint(0, 1000) < self.__recovery_rate * 1000
-
-    def die(self) -> bool:
-        """
-        Simulates whether death occurs based on the mortality rate.
-
-        Returns:
-            bool: True if death occurs, False otherwise.
-        """
-        return random.randint(0, 1000) < self.__mortality_rate * 1000
-
-    def get_incubation_time(self) -> float:
-        """
-        Gets the incubation time of the disease.
-
-        Returns:
-            float: The incubation time of the disease in seconds.
-        """
-        return self.__incubation_time
+"""
+Defines the Disease class to model the spread, recovery, and mortality of an infectious disease.
+
+Imports:
+    numpy
+
+Classes:
+    Disease
+"""
+
+import numpy as np
+
+class Disease:
+    """
+    A class to model the spread, recovery, and mortality of an infectious disease.
+
+    Attributes:
+        __seconds_per_hour (float): The number of seconds per simulation hour.
+        __infection_rate (float): The rate of infection per hour.
+        __incubation_time (float): The incubation time of the disease in real seconds.
+        __recovery_rate (float): The rate of recovery per hour.
+        __mortality_rate (float): The rate of mortality per hour.
+        __rand_pool (np.ndarray): Pre-generated uniform draws consumed by the probability checks.
+        __rand_cursor (int): The index of the next unused draw in the pool.
+    """
+
+    __slots__ = ('__seconds_per_hour', '__infection_rate', '__incubation_time',
+                 '__recovery_rate', '__mortality_rate', '__rand_pool', '__rand_cursor')
+
+    __RAND_POOL_SIZE: int = 65536 # Number of uniform draws generated per batch
+
+    def __init__(self, infection_rate: float, incubation_time: float,
+                 recovery_rate: float, mortality_rate: float,
+                 seconds_per_hour: float) -> None:
+        """
+        Initialises the Disease class with the given parameters.
+
+        Args:
+            infection_rate (float): The rate of infection per day.
+            incubation_time (float): The incubation time in days.
+            recovery_rate (float): The rate of recovery per day.
+            mortality_rate (float): The rate of mortality per day.
+            seconds_per_hour (float): The number of seconds per simulation hour.
+        """
+        self.__seconds_per_hour: float = seconds_per_hour
+        self.__infection_rate: float = infection_rate / 24
+        self.__incubation_time: float = incubation_time * 24 * self.__seconds_per_hour
+        self.__recovery_rate: float = recovery_rate / 24
+        self.__mortality_rate: float = mortality_rate / 24
+        self.__rand_pool: np.ndarray = np.random.random(self.__RAND_POOL_SIZE)
+        self.__rand_cursor: int = 0
+
+    def __draw(self) -> float:
+        """
+        Takes the next uniform draw from the pre-generated pool, refilling it when exhausted.
+
+        Returns:
+            float: A uniform random number in [0, 1).
+        """
+        if self.__rand_cursor >= self.__RAND_POOL_SIZE:
+            self.__rand_pool = np.random.random(self.__RAND_POOL_SIZE) # Refill in one C-level batch
+            self.__rand_cursor = 0
+
+        draw: float = self.__rand_pool[self.__rand_cursor]
+        self.__rand_cursor += 1
+        return draw
+
+    def infect(self) -> bool:
+        """
+        Simulates whether an infection occurs based on the infection rate.
+
+        Returns:
+            bool: True if infection occurs, False otherwise.
+        """
+        return self.__draw() < self.__infection_rate
+
+    def recover(self) -> bool:
+        """
+        Simulates whether recovery occurs based on the recovery rate.
+
+        Returns:
+            bool: True if recovery occurs, False otherwise.
+        """
+        return self.__draw() < self.__recovery_rate
+
+    def die(self) -> bool:
+        """
+        Simulates whether death occurs based on the mortality rate.
+
+        Returns:
+            bool: True if death occurs, False otherwise.
+        """
+        return self.__draw() < self.__mortality_rate
+
+    def get_incubation_time(self) -> float:
+        """
+        Gets the incubation time of the disease.
+
+        Returns:
+            float: The incubation time of the disease in seconds.
+        """
+        return self.__incubation_time
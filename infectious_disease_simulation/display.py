@@ -1,105 +1,114 @@
-"""
-Defines the Display class, which manages display properties and pygame modules for handling display.
-
-Imports:
-    pygame
-
-Classes:
-    Display
-"""
-
-import pygame
-
-class Display:
-    """
-    A class which holds display properties, and pygame modules which manage the display window.
-
-    Attributes:
-        __width (int): The width of the display.
-        __height (int): The height of the display.
-        __caption (str): The display window's caption.
-        __screen (pygame.Surface): The pygame display surface, using the display width and height.
-    """
-    def __init__(self, width: int, height: int, caption: str) -> None:
-        """
-        Initialises the display with given parameters.
-
-        Args:
-            width (int): The width of the display.
-            height (int): The height of the display.
-            caption (str): The display window's caption.
-        """
-        self.__width: int = width
-        self.__height: int = height
-        self.__caption: str = caption
-        self.__screen: pygame.Surface = pygame.display.set_mode((self.__width, self.__height))
-
-    def get_caption(self) -> str:
-        """
-        Returns the caption of the display.
-
-        Returns:
-            str: Caption of the display.
-        """
-        return self.__caption
-
-    def set_caption(self) -> None:
-        """
-        Sets the caption of the display window.
-        """
-        pygame.display.set_caption(self.__caption)
-
-    def fill(self, colour: tuple[int, int, int]) -> None:
-        """
-        Fills the display screen with the given colour.
-
-        Args:
-            colour (tuple[int, int, int]): The colour to fill the display screen with.
-        """
-        self.__screen.fill(colour)
-
-    def update(self) -> None:
-        """
-        Updates the display screen.
-        """
-        pygame.display.update()
-
-    def get_width(self) -> int:
-        """
-        Returns the width of the display screen.
-
-        Returns:
-            int: Width of the display.
-        """
-        return self.__width
-
-    def get_height(self) -> int:
-        """
-        Returns the height of the display screen.
-
-        Returns:
-            int: Height of the display.
-        """
-        return self.__height
-
-    def get_screen(self) -> pygame.Surface:
-        """
-        Returns the display surface.
-
-        Returns:
-            pygame.Surface: The display surface created by pygame.
-        """
-        return self.__screen
-
-    def set_display_icon(self, filepath: str) -> None:
-        """
-        Tries to set the display icon. Does nothing if the file does not exist.
-        
-        Args:
-            filepath (str): Path to the icon image file.
-        """
-        try:
-            icon: pygame.Surface = pygame.image.load(filepath)
-            pygame.display.set_icon(icon)
-        except:
-            pass
+"""
+Defines the Display class, which manages display properties and pygame modules for handling display.
+
+Imports:
+    pygame
+
+Classes:
+    Display
+"""
+
+import pygame
+
+class Display:
+    """
+    A class which holds display properties, and pygame modules which manage the display window.
+
+    Attributes:
+        __width (int): The width of the display.
+        __height (int): The height of the display.
+        __caption (str): The display window's caption.
+        __screen (pygame.Surface): The pygame display surface, using the display width and height.
+    """
+
+    __slots__ = ('__width', '__height', '__caption', '__screen')
+
+    def __init__(self, width: int, height: int, caption: str) -> None:
+        """
+        Initialises the display with given parameters.
+
+        Args:
+            width (int): The width of the display.
+            height (int): The height of the display.
+            caption (str): The display window's caption.
+        """
+        self.__width: int = width
+        self.__height: int = height
+        self.__caption: str = caption
+        self.__screen: pygame.Surface = pygame.display.set_mode((self.__width, self.__height))
+
+    def get_caption(self) -> str:
+        """
+        Returns the caption of the display.
+
+        Returns:
+            str: Caption of the display.
+        """
+        return self.__caption
+
+    def set_caption(self) -> None:
+        """
+        Sets the caption of the display window.
+        """
+        pygame.display.set_caption(self.__caption)
+
+    def fill(self, colour: tuple[int, int, int]) -> None:
+        """
+        Fills the display screen with the given colour.
+
+        Args:
+            colour (tuple[int, int, int]): The colour to fill the display screen with.
+        """
+        self.__screen.fill(colour)
+
+    def update(self, rects: list[pygame.Rect] = None) -> None:
+        """
+        Updates the display screen. If a list of rects is given, only those areas are pushed.
+
+        Args:
+            rects (list[pygame.Rect]): The changed areas to update. Defaults to None (whole display).
+        """
+        if rects is None:
+            pygame.display.update()
+        else:
+            pygame.display.update(rects)
+
+    def get_width(self) -> int:
+        """
+        Returns the width of the display screen.
+
+        Returns:
+            int: Width of the display.
+        """
+        return self.__width
+
+    def get_height(self) -> int:
+        """
+        Returns the height of the display screen.
+
+        Returns:
+            int: Height of the display.
+        """
+        return self.__height
+
+    def get_screen(self) -> pygame.Surface:
+        """
+        Returns the display surface.
+
+        Returns:
+            pygame.Surface: The display surface created by pygame.
+        """
+        return self.__screen
+
+    def set_display_icon(self, filepath: str) -> None:
+        """
+        Tries to set the display icon. Does nothing if the file does not exist.
+        
+        Args:
+            filepath (str): Path to the icon image file.
+        """
+        try:
+            icon: pygame.Surface = pygame.image.load(filepath)
+            pygame.display.set_icon(icon)
+        except:
+            pass
@@ -1,184 +1,194 @@
-"""
-Defines MST class which creates the MST from a graph.
-
-Imports:
-    math
-    numpy
-    create_graph: Creates a graph as an adjacency list from the map array.
-    additional_connections: Adds additional roads to network.
-
-Classes:
-    MST
-"""
-
-import math
-import numpy as np
-import create_graph
-import additional_connections
-
-class MST:
-    """
-    A class to create a MST using Kruskal's algorithm with an adjacency list.
-
-    Attributes:
-        __graph (dict[tuple[int, int], list[tuple[int, int]]]): The graph as an adjacency list.
-        __edges (list[tuple[int, tuple[int, int], tuple[int, int]]])): List of edges with weights.
-        __parent (dict[tuple[int, int], tuple[int, int]])): Dictionary of each node's parent.
-        __rank (dict[tuple[int, int], int]): Dictionary to keep track of the rank of each node.
-    """
-    def __init__(self, map_array: np.ndarray) -> None:
-        """
-        Intialises the MST class with the given map.
-
-        Args:
-            map_array (np.ndarray): A 2D array representing the tilemap.
-        """
-        # Create the graph from the map
-        self.__graph: dict[tuple[int, int], # Create the graph from the map
-                           list[tuple[int, int]]] = self.__swap_coordinates(create_graph.CreateGraph(map_array).make_graph())
-        # Create a list of edges with weights
-        self.__edges: list[tuple[int, tuple[int, int],
-                                 tuple[int, int]]] = self.__create_edge_list()
-        # Initialise the parent dictionary for union-find
-        self.__parent: dict[tuple[int, int], tuple[int, int]] = {}
-        # Initialise the rank dictionary for union-find
-        self.__rank: dict[tuple[int, int], int] = {}
-
-    def __swap_coordinates(self, graph: dict[tuple[int, int],
-                                             list[tuple[int, int]]]) -> dict[tuple[int, int],
-                                                                             list[tuple[int, int]]]:
-        """
-        Swap the coordinates of every node and neighbour in the given graph.
-
-        NOTE: Swapped x, y coordinates due to differences in pygame coordinate system.
-
-        Args:
-            graph (dict[tuple[int, int], list[tuple[int, int]]]): The input graph to swap coordinates.
-
-        Returns:
-            dict[tuple[int, int], list[tuple[int, int]]]: Graph with swapped coordinates for nodes and neighbours.
-        """
-        swapped_graph: dict[tuple[int, int], list[tuple[int, int]]] = {}
-
-        for node, neighbours in graph.items():
-            swapped_node: tuple[int, int] = (node[1], node[0]) # Swap coordinates
-            swapped_neighbours: list[tuple[int, int]] = []
-            for neighbour in neighbours:
-                swapped_neighbours.append((neighbour[1], neighbour[0])) # Add swapped coordinates to list
-            swapped_graph[swapped_node] = swapped_neighbours
-
-        return swapped_graph
-
-    def __create_edge_list(self) -> list[tuple[int, tuple[int, int], tuple[int, int]]]:
-        """
-        Convert the adjacency list to a list of edges with weights.
-
-        Returns:
-            list[tuple[int,
-                       tuple[int, int],
-                       tuple[int, int]]]: List of tuples with weight, start node, end node of edge.
-        """
-        edges: list[tuple[int, tuple[int, int], tuple[int, int]]] = [] # Initialise edges list
-        for node, neighbours in self.__graph.items(): # Iterate through graph
-            for neighbour in neighbours:
-                weight: int = self.__calculate_weight(node, neighbour) # Calculate weight of edge
-                edges.append((weight, node, neighbour)) # Add the edge to the list
-
-        return edges
-
-    def __calculate_weight(self, node1: tuple[int, int], node2: tuple[int, int]) -> int:
-        """
-        Calculate the weight (distance) between two nodes.
-
-        Args:
-            node1 (tuple[int, int]): Coordinates of the first node.
-            node2 (tuple[int, int]): Coordinates of the second node.
-
-        Returns:
-            int: Weight (distance) between the two nodes.
-        """
-        # Calculate the Euclidean distance
-        weight: int = int(math.sqrt((node1[0] - node2[0]) ** 2 + (node1[1] - node2[1]) ** 2))
-        return weight
-
-    def __find(self, node: tuple[int, int]) -> tuple[int, int]:
-        """
-        Finds the root of the set which contains the node.
-        Uses path compression to flatten tree structure, making future operations more efficient.
-        When root found, self.__parent[node] updated to point to root (path compression)
-
-        Args:
-            node (tuple[int, int]): Node to find the root of.
-        
-        Returns:
-            tuple[int, int]: Root of the set containing the node.
-        """
-        if self.__parent[node] != node: # If node not the root
-            self.__parent[node] = self.__find(self.__parent[node]) # Recursively call on node's parent until root found
-
-        return self.__parent[node] # Returns root of the set containing original node
-
-    def __union(self, node1: tuple[int, int], node2: tuple[int, int]) -> None:
-        """
-        Merges two disjoint sets into a single set.
-
-        Args:
-            node1 (tuple[int, int]): The first node.
-            node2 (tuple[int, int]): The second node.
-        """
-        root1: tuple[int, int] = self.__find(node1) # Find root of set containing node1
-        root2: tuple[int, int] = self.__find(node2) # Find root of set containing node2
-
-        if self.__rank[root1] > self.__rank[root2]: # root1 rank higher than root2
-            self.__parent[root2] = root1 # root1 made parent of root2 => root2 now points to root1
-        elif self.__rank[root1] < self.__rank[root2]: # root2 rank higher than root1
-            self.__parent[root1] = root2 # root2 made parent of root1 => root1 now points to root2
-        else: # root1 and root2 are equal rank
-            self.__parent[root2] = root1 # root1 made parent of root2
-            self.__rank[root1] += 1 # root1 rank (height of tree with root root1) increased by 1
-
-    def __kruskal(self) -> dict[tuple[int, int], list[tuple[tuple[int, int], int]]]:
-        """
-        Carry out Kruskal's algorithm to find the MST.
-
-        Returns:
-            dict[tuple[int, int], 
-                 list[tuple[tuple[int, int],
-                 int]]]: The MST represented as an adjacency list.
-        """
-        # Initialise empty dictionary for MST
-        mst: dict[tuple[int, int],
-                  list[tuple[tuple[int, int], int]]] = {}
-
-        for node in self.__graph: # Iterate through graph
-            self.__parent[node] = node # Intialise each node's parent to itself
-            self.__rank[node] = 0 # Initialise each node's rank to 0
-
-        self.__edges.sort() # Sort edges by weight
-
-        for edge in self.__edges: # Iterate through edges
-            weight, node1, node2 = edge
-            if self.__find(node1) != self.__find(node2): # If node1 and node2 are in different sets
-                self.__union(node1, node2) # Merge the sets containing node1 and node2
-                if node1 not in mst:
-                    mst[node1] = [] # List for node1 if it doesn't exist
-                if node2 not in mst:
-                    mst[node2] = [] # List for node2 if it doesn't exist
-                mst[node1].append((node2, weight)) # Add edge to MST
-                mst[node2].append((node1, weight)) # Add edge to MST
-
-        return mst
-
-    def get_mst(self, additional_roads) -> dict[tuple[int, int], list[tuple[tuple[int, int], int]]]:
-        """
-        Get the MST of the graph.
-
-        Returns:
-            dict[tuple[int, int],
-                 list[tuple[tuple[int, int],
-                 int]]]: MST represented as an adjacency list.
-        """
-        if additional_roads:
-            # Result of Kruskal's algorithm taken and additional connections found using it
-            return additional_connections.AdditionalConnections(self.__kruskal()).add_connections()
-        return self.__kruskal() # Run Kruskal's algorithm and return the MST
+"""
+Defines MST class which creates the MST from a graph.
+
+Imports:
+    collections
+    numpy
+    create_graph: Creates a graph as an adjacency list from the map array.
+    additional_connections: Adds additional roads to network.
+
+Classes:
+    MST
+"""
+
+from collections import defaultdict
+import numpy as np
+import create_graph
+import additional_connections
+
+class MST:
+    """
+    A class to create a MST using Kruskal's algorithm with an adjacency list.
+
+    Attributes:
+        __graph (dict[tuple[int, int], list[tuple[int, int]]]): The graph as an adjacency list.
+        __nodes (list[tuple[int, int]]): The nodes in pygame coordinate order, indexed by their
+                                         dense integer id.
+        __edge_sq_weights (np.ndarray): The squared weight of each edge (the Kruskal sort key).
+        __edge_ids (np.ndarray): The (start id, end id) endpoint pair of each edge.
+        __parent (np.ndarray): Array of each node's parent id for union-find.
+        __rank (np.ndarray): Array to keep track of the rank of each node.
+    """
+    def __init__(self, map_array: np.ndarray) -> None:
+        """
+        Intialises the MST class with the given map.
+
+        Args:
+            map_array (np.ndarray): A 2D array representing the tilemap.
+        """
+        # Create the graph from the map
+        self.__graph: dict[tuple[int, int],
+                           list[tuple[int, int]]] = create_graph.CreateGraph(map_array).make_graph()
+        # One pass over the graph numbers the nodes, swaps their coordinates and
+        # collects the edge arrays of squared weights and endpoint id pairs
+        self.__nodes, self.__edge_sq_weights, self.__edge_ids = self.__build()
+        # Initialise the parent array for union-find (reset at the start of each Kruskal run)
+        self.__parent: np.ndarray = np.arange(len(self.__nodes), dtype=np.int32)
+        # Initialise the rank array for union-find
+        self.__rank: np.ndarray = np.zeros(len(self.__nodes), dtype=np.int8)
+
+    def __build(self) -> tuple[list[tuple[int, int]], np.ndarray, np.ndarray]:
+        """
+        Walks the graph exactly once, numbering each node, swapping its coordinates into
+        pygame order, and collecting every edge; the squared weights and dense endpoint
+        ids are then derived with vectorised NumPy operations. Fuses what used to be
+        separate swap, numbering and edge-list passes over the same dict.
+
+        NOTE: coordinates are swapped due to differences in the pygame coordinate system;
+        the swap changes nothing for distances or ids. The weights are kept squared:
+        square root is monotone, so ordering by squared distance picks the same MST, and
+        only the accepted edges ever need the real value.
+
+        Returns:
+            tuple[list[tuple[int, int]],
+                  np.ndarray, np.ndarray]: The nodes by id, the per-edge squared weights
+                                           and the (start id, end id) pairs.
+        """
+        nodes: list[tuple[int, int]] = [] # The nodes, swapped, indexed by their dense id
+        # Each node's coordinates packed into a single integer (coordinates are map cell
+        # indices, far below the 16-bit limit), so translating edge endpoints to dense
+        # ids is a vectorised searchsorted instead of a tuple-keyed dict lookup per endpoint
+        packed_keys: list[int] = []
+        packed_endpoints: list[int] = [] # Start and end of each edge, packed, interleaved
+
+        for node, neighbours in self.__graph.items(): # The single pass over the graph
+            nodes.append((node[1], node[0])) # Swap coordinates
+            packed_node: int = (node[0] << 16) | node[1]
+            packed_keys.append(packed_node)
+            for neighbour in neighbours:
+                packed_neighbour: int = (neighbour[0] << 16) | neighbour[1]
+                # The adjacency list stores both directions of every edge; keeping only
+                # one halves the sort and union-find work with no effect on the MST
+                if packed_node < packed_neighbour:
+                    packed_endpoints.append(packed_node) # Add the edge to the list
+                    packed_endpoints.append(packed_neighbour)
+
+        # Translate every endpoint to its dense id in one vectorised lookup
+        packed_nodes: np.ndarray = np.asarray(packed_keys, dtype=np.uint32)
+        node_order: np.ndarray = np.argsort(packed_nodes, kind='stable') # searchsorted needs sorted keys
+        endpoint_array: np.ndarray = np.asarray(packed_endpoints, dtype=np.uint32)
+        positions: np.ndarray = np.searchsorted(packed_nodes[node_order], endpoint_array)
+        id_pairs: np.ndarray = node_order[positions].astype(np.int32).reshape(-1, 2)
+
+        # Calculate the squared Euclidean distance of every edge at once
+        nodes_xy: np.ndarray = np.asarray(nodes, dtype=np.int32)
+        deltas: np.ndarray = nodes_xy[id_pairs[:, 0]] - nodes_xy[id_pairs[:, 1]]
+        sq_weights: np.ndarray = (deltas * deltas).sum(axis=1).astype(np.int32)
+
+        return nodes, sq_weights, id_pairs
+
+    def __find(self, node_id: int) -> int:
+        """
+        Finds the root of the set which contains the node.
+        Uses path halving to flatten tree structure, making future operations more efficient:
+        every visited node is pointed at its grandparent in the same single upward walk,
+        so no second pass (and no recursion) is needed.
+
+        Args:
+            node_id (int): Id of the node to find the root of.
+        
+        Returns:
+            int: Id of the root of the set containing the node.
+        """
+        parent: np.ndarray = self.__parent
+
+        while parent[node_id] != node_id: # Walk up until the root is found
+            parent[node_id] = parent[parent[node_id]] # Point the node at its grandparent
+            node_id = parent[node_id]
+
+        return int(node_id) # Returns root of the set containing original node
+
+    def __union(self, node1: int, node2: int) -> None:
+        """
+        Merges two disjoint sets into a single set.
+
+        Args:
+            node1 (int): The first node's id.
+            node2 (int): The second node's id.
+        """
+        root1: int = self.__find(node1) # Find root of set containing node1
+        root2: int = self.__find(node2) # Find root of set containing node2
+
+        if self.__rank[root1] > self.__rank[root2]: # root1 rank higher than root2
+            self.__parent[root2] = root1 # root1 made parent of root2 => root2 now points to root1
+        elif self.__rank[root1] < self.__rank[root2]: # root2 rank higher than root1
+            self.__parent[root1] = root2 # root2 made parent of root1 => root1 now points to root2
+        else: # root1 and root2 are equal rank
+            self.__parent[root2] = root1 # root1 made parent of root2
+            self.__rank[root1] += 1 # root1 rank (height of tree with root root1) increased by 1
+
+    def __kruskal(self) -> dict[tuple[int, int], list[tuple[tuple[int, int], int]]]:
+        """
+        Carry out Kruskal's algorithm to find the MST.
+
+        Returns:
+            dict[tuple[int, int], 
+                 list[tuple[tuple[int, int],
+                 int]]]: The MST represented as an adjacency list.
+        """
+        # Initialise empty dictionary for MST (defaultdict saves the membership probes per edge)
+        mst: defaultdict[tuple[int, int],
+                         list[tuple[tuple[int, int], int]]] = defaultdict(list)
+
+        num_nodes: int = len(self.__nodes)
+        self.__parent = np.arange(num_nodes, dtype=np.int32) # Intialise each node's parent to itself
+        self.__rank = np.zeros(num_nodes, dtype=np.int8) # Initialise each node's rank to 0
+
+        # Sort edges by squared weight: a stable argsort on the int32 key array, so the
+        # ordering costs C-level passes rather than Python tuple comparisons
+        order: np.ndarray = np.argsort(self.__edge_sq_weights, kind='stable')
+        id_pairs: list[list[int]] = self.__edge_ids.tolist()
+
+        accepted: list[tuple[int, int, int]] = [] # (edge index, id1, id2) per accepted edge
+        for index in order.tolist(): # Iterate through edges in weight order
+            id1, id2 = id_pairs[index]
+            if self.__find(id1) != self.__find(id2): # If node1 and node2 are in different sets
+                self.__union(id1, id2) # Merge the sets containing node1 and node2
+                accepted.append((index, id1, id2)) # Edge is part of the MST
+
+        # Only the accepted edges need their real weight, in one vectorised square root
+        accepted_indices: np.ndarray = np.asarray([index for index, _, _ in accepted], dtype=np.int64)
+        final_weights: list[int] = np.sqrt(self.__edge_sq_weights[accepted_indices]).astype(np.int32).tolist()
+
+        nodes: list[tuple[int, int]] = self.__nodes
+        for (_, id1, id2), weight in zip(accepted, final_weights):
+            node1: tuple[int, int] = nodes[id1] # Translate ids back to coordinates
+            node2: tuple[int, int] = nodes[id2]
+            mst[node1].append((node2, weight)) # Add edge to MST
+            mst[node2].append((node1, weight)) # Add edge to MST
+
+        return dict(mst) # Plain dict, matching the declared return type
+
+    def get_mst(self, additional_roads) -> dict[tuple[int, int], list[tuple[tuple[int, int], int]]]:
+        """
+        Get the MST of the graph.
+
+        Returns:
+            dict[tuple[int, int],
+                 list[tuple[tuple[int, int],
+                 int]]]: MST represented as an adjacency list.
+        """
+        if additional_roads:
+            # Result of Kruskal's algorithm taken and additional connections found using it
+            return additional_connections.AdditionalConnections(self.__kruskal()).add_connections()
+        return self.__kruskal() # Run Kruskal's algorithm and return the MST
@@ -1,322 +1,414 @@
-"""
-Defines the Person class which manages a person in the simulation.
-
-Imports:
-    math
-    pygame
-    display: Manages display settings and updates.
-    disease: Simulates disease probabilities.
-
-Classes:
-    Person
-"""
-import math
-import pygame
-import display # For typing
-import disease # For typing
-
-class Person:
-    """
-    A class to manage a person in the simulation, including their movement and infection status.
-
-    Attributes:
-        __display (display.Display): The display surface.
-        __person_id (int): The ID of the person.
-        __home_location (tuple[int, int]): The home location of the person.
-        __office_location (tuple[int, int]): The office location of the person.
-        __current_location (tuple[int, int]): The current location of the person.
-        __home_position (tuple[int, int]): The position within the home.
-        __office_position (tuple[int, int]): The position within the office.
-        __current_position (tuple[int, int]): The current position of the person.
-        __home_radius (int): The radius of the person in their home.
-        __office_radius (int): The radius of the person in their office.
-        __home_to_office_route (list[tuple[int, int]]): The route from home to office.
-        __office_to_home_route (list[tuple[int, int]]): The route from office to home.
-        __speed (float): The speed of the person.
-        __leave_home (int): The time to leave home.
-        __status (str): The infection status of the person ('S', 'E', 'I', 'R', 'D').
-        __route (list[tuple[int, int]]): The current route.
-        __route_index (int): The index of the current position in the route.
-        __moving (bool): Whether the person is moving.
-        __disease (disease.Disease): The disease object managing infection.
-        __incubation_time (float): The incubation time remaining for the person before becoming infectious.
-        __seconds_per_hour (float): The number of seconds per simulation hour.
-    """
-    def __init__(self, display_obj: display.Display,
-                 person_id: int,
-                 home_location: tuple[int, int], office_location: tuple[int, int], home_position: tuple[int, int],
-                 home_radius: int, office_radius: int,
-                 home_to_office_route: list[tuple[int, int]],
-                 speed: float, leave_home: int, status: str,
-                 disease_obj: disease.Disease, incubation_time: float,
-                 seconds_per_hour: float) -> None:
-        """
-        Initialises the Person class with the given parameters.
-
-        Args:
-            display_obj (display.Display): The display surface.
-            person_id (int): The ID of the person.
-            home_location (tuple[int, int]): The home location of the person.
-            office_location (tuple[int, int]): The office location of the person.
-            home_position (tuple[int, int]): The position within the home.
-            home_radius (int): The radius of the home.
-            office_radius (int): The radius of the office.
-            home_to_office_route (list[tuple[int, int]]): The route from home to office.
-            speed (float): The speed of the person.
-            leave_home (int): The time to leave home.
-            status (str): The infection status of the person.
-            disease_obj (disease.Disease): The disease object managing infection.
-            incubation_time (float): The incubation time for the disease.
-            seconds_per_hour (float): The number of seconds per simulation hour.
-        """
-        self.__display: display.Display = display_obj
-        self.__person_id: int = person_id
-        self.__home_location: tuple[int, int] = home_location
-        self.__office_location: tuple[int, int] = office_location
-        self.__current_location: tuple[int, int] = self.__home_location
-        self.__home_position: tuple[int, int] = home_position
-        self.__office_position: tuple[int, int] = None
-        self.__current_position: tuple[int, int] = self.__home_position
-        self.__home_radius: int = home_radius
-        self.__office_radius: int = office_radius
-        self.__home_to_office_route: list[tuple[int, int]] = home_to_office_route
-        self.__office_to_home_route: list[tuple[int, int]] = None
-        self.__speed: float = speed
-        self.__leave_home: int = leave_home
-        self.__status: str = status  # S = Susceptible, E = Exposed, I = Infected, R = Recovered, D = Deceased
-        self.__route: list[tuple[int, int]] = None
-        self.__route_index: int = 0
-        self.__moving: bool = False
-        self.__disease: disease.Disease = disease_obj
-        self.__incubation_time: float = incubation_time
-        self.__seconds_per_hour: float = seconds_per_hour
-
-    def draw_person(self) -> None:
-        """
-        Draws the person as a circle on the display surface.
-        """
-        pygame.draw.circle(self.__display.get_screen(),
-                           self.get_colour(),
-                           (int(self.__current_position[0]), int(self.__current_position[1])),
-                           self.get_radius())
-
-    def get_leave_home(self) -> int:
-        """
-        Gets the time to leave home.
-
-        Returns:
-            int: The time to leave home.
-        """
-        return self.__leave_home
-
-    def get_home_location(self) -> tuple[int, int]:
-        """
-        Gets the home location of the person.
-
-        Returns:
-            tuple[int, int]: The home location.
-        """
-        return self.__home_location
-
-    def get_office_location(self) -> tuple[int, int]:
-        """
-        Gets the office location of the person.
-
-        Returns:
-            tuple[int, int]: The office location.
-        """
-        return self.__office_location
-
-    def get_current_location(self) -> tuple[int, int]:
-        """
-        Gets the current location of the person.
-
-        Returns:
-            tuple[int, int]: The current location.
-        """
-        return self.__current_location
-
-    def set_current_location(self, new_location: tuple[int, int]) -> None:
-        """
-        Sets the current location of the person.
-
-        Args:
-            new_location (tuple[int, int]): The new location of the person.
-        """
-        self.__current_location = new_location
-
-    def get_home_position(self) -> tuple[int, int]:
-        """
-        Gets the home position of the person.
-
-        Returns:
-            tuple[int, int]: The home position of the person.
-        """
-        return self.__home_position
-
-    def get_office_position(self) -> tuple[int, int]:
-        """
-        Gets the office position of the person.
-
-        Returns:
-            tuple[int, int]: The office position of the person.
-        """
-        return self.__office_position
-
-    def set_office_position(self, office_position: tuple[int, int]) -> None:
-        """
-        Sets the office position of the person and updates the route from home to office.
-
-        Args:
-            office_position (tuple[int, int]): The new office position of the person.
-        """
-        self.__office_position = office_position
-        self.__home_to_office_route.insert(0, self.__home_position)
-        self.__home_to_office_route.append(office_position)
-        self.__office_to_home_route = list(reversed(self.__home_to_office_route))
-
-    def get_current_position(self) -> tuple[int, int]:
-        """
-        Gets the current position of the person.
-
-        Returns:
-            tuple[int, int]: The current position of the person.
-        """
-        return self.__current_position
-
-    def set_current_position(self, new_position: tuple[int, int]) -> None:
-        """
-        Sets the current position of the person.
-
-        Args:
-            new_position (tuple[int, int]): The new position of the person.
-        """
-        self.__current_position = new_position
-
-    def get_radius(self) -> int:
-        """
-        Gets the radius corresponding to the current position of the person.
-
-        Returns:
-            int: The corresponding to the current position of the person.
-        """
-        if self.__current_position == self.__home_position:
-            return self.__home_radius
-        return self.__office_radius
-
-    def get_colour(self) -> tuple[int, int, int]:
-        """
-        Gets the color representing the infection status of the person.
-
-        Returns:
-            tuple[int, int, int]: The RGB color based on the infection status.
-        """
-        status_colours = {
-            "S": (144, 238, 144),  # Green
-            "E": (255, 255, 0),    # Yellow
-            "I": (255, 0, 0),      # Red
-            "R": (204, 153, 255),  # Light Purple
-            "D": (50, 50, 50)      # Dark Grey
-        }
-        return status_colours[self.__status]
-
-    def start_move_to_office(self) -> None:
-        """
-        Starts the movement from home to the office if the person is not deceased.
-        """
-        if self.__status != 'D':
-            self.__route = self.__home_to_office_route
-            self.__route_index = 0
-            self.__moving = True
-
-    def start_move_to_home(self) -> None:
-        """
-        Starts the movement from the office to home if the person is not deceased.
-        """
-        if self.__status != 'D':
-            self.__route = self.__office_to_home_route
-            self.__route_index = 0
-            self.__moving = True
-
-    def update_position(self) -> None:
-        """
-        Updates the position of the person based on their route and speed. Stops moving if the person is deceased.
-
-        If the person is moving, the position is updated along the route. If the person reaches the next position
-        in the route, the route index is incremented. If the person reaches the end of the route, they stop moving.
-        """
-        if self.__status == 'D':
-            self.__moving = False
-            self.draw_person()
-            return
-
-        if self.__moving and self.__route_index < len(self.__route):
-            next_position: tuple[int, int] = self.__route[self.__route_index]
-            dx: float = next_position[0] - self.__current_position[0]
-            dy: float = next_position[1] - self.__current_position[1]
-            distance: float = math.sqrt(dx ** 2 + dy ** 2)
-            # Adjust speed for smooth movement and avoid overshooting next position
-            if distance < self.__speed:
-                self.__current_position = next_position
-                self.__route_index += 1
-                if self.__route_index >= len(self.__route):
-                    self.__moving = False
-            else:
-                dx = dx / distance * self.__speed
-                dy = dy / distance * self.__speed
-                self.__current_position = (self.__current_position[0] + dx, self.__current_position[1] + dy)
-
-    def update_infection_status(self) -> None:
-        """
-        Updates the infection status of the person based on disease progression.
-
-        If the person is exposed, the incubation time is decreased. If the incubation time reaches zero, the status
-        changes to infected. If the person is infected, their status may change to recovered or deceased based on
-        the disease recovery and mortality rates.
-        """
-        if self.__status == "E":
-            self.__incubation_time -= self.__seconds_per_hour  # Decrease incubation time
-            if self.__incubation_time <= 0: # Set to infected once incubation time left reaches 0
-                self.__status = "I"
-        elif self.__status == "I":
-            if self.__disease.recover(): # Probability of recovering
-                self.__status = "R"
-            elif self.__disease.die(): # Probability of dying
-                self.__status = "D"
-                self.__moving = False
-
-    def get_status(self) -> str:
-        """
-        Gets the current infection status of the person.
-
-        Returns:
-            str: The current infection status (S, E, I, R, D).
-        """
-        return self.__status
-
-    def set_status(self, status: str) -> None:
-        """
-        Sets the infection status of the person.
-
-        Args:
-            status (str): The new infection status (S, E, I, R, D).
-        """
-        self.__status = status
-
-    def get_person_id(self) -> int:
-        """
-        Gets the ID of the person.
-
-        Returns:
-            int: The ID of the person.
-        """
-        return self.__person_id
-
-    def get_home_to_office_route(self) -> list[tuple[int, int]]:
-        """
-        Gets the route from home to office.
-
-        Returns:
-            list[tuple[int, int]]: The route from home to office.
-        """
-        return self.__home_to_office_route
+"""
+Defines the Person class which manages a person in the simulation.
+
+Imports:
+    math
+    pygame
+    display: Manages display settings and updates.
+    disease: Simulates disease probabilities.
+
+Classes:
+    Person
+"""
+import math
+import pygame
+import display # For typing
+import disease # For typing
+
+# Colour for each infection status, built once instead of per get_colour call
+STATUS_COLOURS: dict[str, tuple[int, int, int]] = {
+    "S": (144, 238, 144),  # Green
+    "E": (255, 255, 0),    # Yellow
+    "I": (255, 0, 0),      # Red
+    "R": (204, 153, 255),  # Light Purple
+    "D": (50, 50, 50)      # Dark Grey
+}
+
+class Person:
+    """
+    A class to manage a person in the simulation, including their movement and infection status.
+
+    Attributes:
+        __display (display.Display): The display surface.
+        __person_id (int): The ID of the person.
+        __home_location (tuple[int, int]): The home location of the person.
+        __office_location (tuple[int, int]): The office location of the person.
+        __current_location (tuple[int, int]): The current location of the person.
+        __home_position (tuple[int, int]): The position within the home.
+        __office_position (tuple[int, int]): The position within the office.
+        __current_position (tuple[int, int]): The current position of the person.
+        __home_radius (int): The radius of the person in their home.
+        __office_radius (int): The radius of the person in their office.
+        __home_squared_contact_distance (int): The squared contact distance while at home.
+        __office_squared_contact_distance (int): The squared contact distance while away from home.
+        __home_to_office_route (list[tuple[int, int]]): The route from home to office.
+        __speed (float): The speed of the person.
+        __leave_home (int): The time to leave home.
+        __status (str): The infection status of the person ('S', 'E', 'I', 'R', 'D').
+        __direction (int): The direction of travel along the route: 1 towards the office, -1 towards home.
+        __route_index (int): The number of route positions passed on the current journey.
+        __moving (bool): Whether the person is moving.
+        __disease (disease.Disease): The disease object managing infection.
+        __incubation_time (float): The incubation time remaining for the person before becoming infectious.
+        __seconds_per_hour (float): The number of seconds per simulation hour.
+        __drawn_rect (pygame.Rect): The screen area covered the last time the person was drawn.
+        __sprite_cache (dict[tuple[tuple[int, int, int], int], pygame.Surface]): Pre-rendered circle
+                                                                                 sprites shared by all
+                                                                                 people, keyed by
+                                                                                 (colour, radius).
+    """
+
+    __slots__ = ('__display', '__person_id', '__home_location', '__office_location', '__current_location',
+                 '__home_position', '__office_position', '__current_position', '__home_radius',
+                 '__office_radius', '__home_squared_contact_distance', '__office_squared_contact_distance',
+                 '__home_to_office_route', '__speed',
+                 '__leave_home', '__status', '__direction', '__route_index', '__moving', '__disease',
+                 '__incubation_time', '__seconds_per_hour', '__drawn_rect')
+
+    # Shared across all people: there are only a handful of (colour, radius) combinations,
+    # so each circle is rasterised once and blitted thereafter instead of redrawn every frame
+    __sprite_cache: dict[tuple[tuple[int, int, int], int], pygame.Surface] = {}
+
+    def __init__(self, display_obj: display.Display,
+                 person_id: int,
+                 home_location: tuple[int, int], office_location: tuple[int, int], home_position: tuple[int, int],
+                 home_radius: int, office_radius: int,
+                 home_to_office_route: list[tuple[int, int]],
+                 speed: float, leave_home: int, status: str,
+                 disease_obj: disease.Disease, incubation_time: float,
+                 seconds_per_hour: float) -> None:
+        """
+        Initialises the Person class with the given parameters.
+
+        Args:
+            display_obj (display.Display): The display surface.
+            person_id (int): The ID of the person.
+            home_location (tuple[int, int]): The home location of the person.
+            office_location (tuple[int, int]): The office location of the person.
+            home_position (tuple[int, int]): The position within the home.
+            home_radius (int): The radius of the home.
+            office_radius (int): The radius of the office.
+            home_to_office_route (list[tuple[int, int]]): The route from home to office.
+            speed (float): The speed of the person.
+            leave_home (int): The time to leave home.
+            status (str): The infection status of the person.
+            disease_obj (disease.Disease): The disease object managing infection.
+            incubation_time (float): The incubation time for the disease.
+            seconds_per_hour (float): The number of seconds per simulation hour.
+        """
+        self.__display: display.Display = display_obj
+        self.__person_id: int = person_id
+        self.__home_location: tuple[int, int] = home_location
+        self.__office_location: tuple[int, int] = office_location
+        self.__current_location: tuple[int, int] = self.__home_location
+        self.__home_position: tuple[int, int] = home_position
+        self.__office_position: tuple[int, int] = None
+        self.__current_position: tuple[int, int] = self.__home_position
+        self.__home_radius: int = home_radius
+        self.__office_radius: int = office_radius
+        # Contact distances precomputed so the per-tick checks avoid the arithmetic
+        self.__home_squared_contact_distance: int = (2 * home_radius) ** 2
+        self.__office_squared_contact_distance: int = (2 * office_radius) ** 2
+        self.__home_to_office_route: list[tuple[int, int]] = home_to_office_route
+        self.__speed: float = speed
+        self.__leave_home: int = leave_home
+        self.__status: str = status  # S = Susceptible, E = Exposed, I = Infected, R = Recovered, D = Deceased
+        self.__direction: int = 1
+        self.__route_index: int = 0
+        self.__moving: bool = False
+        self.__disease: disease.Disease = disease_obj
+        self.__incubation_time: float = incubation_time
+        self.__seconds_per_hour: float = seconds_per_hour
+        self.__drawn_rect: pygame.Rect = None
+
+    def draw_person(self) -> None:
+        """
+        Draws the person's circle sprite on the display surface and remembers the area covered,
+        so the renderer can restore and update just that area next frame.
+        """
+        sprite, destination = self.get_blit()
+        self.__drawn_rect = self.__display.get_screen().blit(sprite, destination)
+
+    def get_blit(self) -> tuple[pygame.Surface, tuple[int, int]]:
+        """
+        Gets the person's circle sprite and its destination on screen, for batched drawing
+        with Surface.blits, and remembers the area the blit will cover.
+
+        Returns:
+            tuple[pygame.Surface, tuple[int, int]]: The sprite and its top-left screen position.
+        """
+        sprite: pygame.Surface = self.__get_sprite()
+        radius: int = self.get_radius()
+        destination: tuple[int, int] = (int(self.__current_position[0]) - radius,
+                                        int(self.__current_position[1]) - radius)
+        self.__drawn_rect = pygame.Rect(destination, sprite.get_size())
+        return sprite, destination
+
+    def __get_sprite(self) -> pygame.Surface:
+        """
+        Gets the pre-rendered circle sprite for the person's current colour and radius,
+        rasterising and caching it on first use.
+
+        Returns:
+            pygame.Surface: The circle sprite.
+        """
+        radius: int = self.get_radius()
+        key: tuple[tuple[int, int, int], int] = (self.get_colour(), radius)
+        sprite: pygame.Surface = Person.__sprite_cache.get(key)
+
+        if sprite is None:
+            sprite = pygame.Surface((2 * radius + 1, 2 * radius + 1), pygame.SRCALPHA)
+            pygame.draw.circle(sprite, key[0], (radius, radius), radius)
+            Person.__sprite_cache[key] = sprite
+
+        return sprite
+
+    def get_drawn_rect(self) -> pygame.Rect:
+        """
+        Gets the screen area covered the last time the person was drawn.
+
+        Returns:
+            pygame.Rect: The last drawn area, or None if the person has never been drawn.
+        """
+        return self.__drawn_rect
+
+    def get_leave_home(self) -> int:
+        """
+        Gets the time to leave home.
+
+        Returns:
+            int: The time to leave home.
+        """
+        return self.__leave_home
+
+    def get_home_location(self) -> tuple[int, int]:
+        """
+        Gets the home location of the person.
+
+        Returns:
+            tuple[int, int]: The home location.
+        """
+        return self.__home_location
+
+    def get_office_location(self) -> tuple[int, int]:
+        """
+        Gets the office location of the person.
+
+        Returns:
+            tuple[int, int]: The office location.
+        """
+        return self.__office_location
+
+    def get_current_location(self) -> tuple[int, int]:
+        """
+        Gets the current location of the person.
+
+        Returns:
+            tuple[int, int]: The current location.
+        """
+        return self.__current_location
+
+    def set_current_location(self, new_location: tuple[int, int]) -> None:
+        """
+        Sets the current location of the person.
+
+        Args:
+            new_location (tuple[int, int]): The new location of the person.
+        """
+        self.__current_location = new_location
+
+    def get_home_position(self) -> tuple[int, int]:
+        """
+        Gets the home position of the person.
+
+        Returns:
+            tuple[int, int]: The home position of the person.
+        """
+        return self.__home_position
+
+    def get_office_position(self) -> tuple[int, int]:
+        """
+        Gets the office position of the person.
+
+        Returns:
+            tuple[int, int]: The office position of the person.
+        """
+        return self.__office_position
+
+    def set_office_position(self, office_position: tuple[int, int]) -> None:
+        """
+        Sets the office position of the person and updates the route from home to office.
+        The one stored route serves both journeys: it is walked backwards to get home,
+        so no reversed copy is kept.
+
+        Args:
+            office_position (tuple[int, int]): The new office position of the person.
+        """
+        self.__office_position = office_position
+        self.__home_to_office_route.insert(0, self.__home_position)
+        self.__home_to_office_route.append(office_position)
+
+    def get_current_position(self) -> tuple[int, int]:
+        """
+        Gets the current position of the person.
+
+        Returns:
+            tuple[int, int]: The current position of the person.
+        """
+        return self.__current_position
+
+    def set_current_position(self, new_position: tuple[int, int]) -> None:
+        """
+        Sets the current position of the person.
+
+        Args:
+            new_position (tuple[int, int]): The new position of the person.
+        """
+        self.__current_position = new_position
+
+    def get_radius(self) -> int:
+        """
+        Gets the radius corresponding to the current position of the person.
+
+        Returns:
+            int: The corresponding to the current position of the person.
+        """
+        if self.__current_position == self.__home_position:
+            return self.__home_radius
+        return self.__office_radius
+
+    def get_squared_contact_distance(self) -> int:
+        """
+        Gets the squared contact distance (twice the radius, squared) corresponding to the
+        current position of the person, precomputed at initialisation.
+
+        Returns:
+            int: The squared contact distance corresponding to the current position.
+        """
+        if self.__current_position == self.__home_position:
+            return self.__home_squared_contact_distance
+        return self.__office_squared_contact_distance
+
+    def get_maximum_radius(self) -> int:
+        """
+        Gets the larger of the person's home and office radii.
+
+        Returns:
+            int: The maximum radius the person can be drawn with.
+        """
+        return max(self.__home_radius, self.__office_radius)
+
+    def get_colour(self) -> tuple[int, int, int]:
+        """
+        Gets the color representing the infection status of the person.
+
+        Returns:
+            tuple[int, int, int]: The RGB color based on the infection status.
+        """
+        return STATUS_COLOURS[self.__status]
+
+    def start_move_to_office(self) -> None:
+        """
+        Starts the movement from home to the office if the person is not deceased.
+        """
+        if self.__status != 'D':
+            self.__direction = 1
+            self.__route_index = 0
+            self.__moving = True
+
+    def start_move_to_home(self) -> None:
+        """
+        Starts the movement from the office to home if the person is not deceased.
+        """
+        if self.__status != 'D':
+            self.__direction = -1
+            self.__route_index = 0
+            self.__moving = True
+
+    def update_position(self) -> None:
+        """
+        Updates the position of the person based on their route and speed. Stops moving if the person is deceased.
+
+        If the person is moving, the position is updated along the route. If the person reaches the next position
+        in the route, the route index is incremented. If the person reaches the end of the route, they stop moving.
+        """
+        if self.__status == 'D':
+            self.__moving = False
+            self.draw_person()
+            return
+
+        route: list[tuple[int, int]] = self.__home_to_office_route
+        if self.__moving and self.__route_index < len(route):
+            # Walk the route forwards to the office, backwards to home
+            if self.__direction == 1:
+                next_position: tuple[int, int] = route[self.__route_index]
+            else:
+                next_position: tuple[int, int] = route[len(route) - 1 - self.__route_index]
+            dx: float = next_position[0] - self.__current_position[0]
+            dy: float = next_position[1] - self.__current_position[1]
+            distance: float = math.sqrt(dx ** 2 + dy ** 2)
+            # Adjust speed for smooth movement and avoid overshooting next position
+            if distance < self.__speed:
+                self.__current_position = next_position
+                self.__route_index += 1
+                if self.__route_index >= len(route):
+                    self.__moving = False
+            else:
+                dx = dx / distance * self.__speed
+                dy = dy / distance * self.__speed
+                self.__current_position = (self.__current_position[0] + dx, self.__current_position[1] + dy)
+
+    def update_infection_status(self) -> None:
+        """
+        Updates the infection status of the person based on disease progression.
+
+        If the person is exposed, the incubation time is decreased. If the incubation time reaches zero, the status
+        changes to infected. If the person is infected, their status may change to recovered or deceased based on
+        the disease recovery and mortality rates.
+        """
+        if self.__status == "E":
+            self.__incubation_time -= self.__seconds_per_hour  # Decrease incubation time
+            if self.__incubation_time <= 0: # Set to infected once incubation time left reaches 0
+                self.__status = "I"
+        elif self.__status == "I":
+            if self.__disease.recover(): # Probability of recovering
+                self.__status = "R"
+            elif self.__disease.die(): # Probability of dying
+                self.__status = "D"
+                self.__moving = False
+
+    def get_status(self) -> str:
+        """
+        Gets the current infection status of the person.
+
+        Returns:
+            str: The current infection status (S, E, I, R, D).
+        """
+        return self.__status
+
+    def set_status(self, status: str) -> None:
+        """
+        Sets the infection status of the person.
+
+        Args:
+            status (str): The new infection status (S, E, I, R, D).
+        """
+        self.__status = status
+
+    def get_person_id(self) -> int:
+        """
+        Gets the ID of the person.
+
+        Returns:
+            int: The ID of the person.
+        """
+        return self.__person_id
+
+    def get_home_to_office_route(self) -> list[tuple[int, int]]:
+        """
+        Gets the route from home to office.
+
+        Returns:
+            list[tuple[int, int]]: The route from home to office.
+        """
+        return self.__home_to_office_route
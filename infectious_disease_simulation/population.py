@@ -1,209 +1,310 @@
-"""
-Defines the Population class to manage the collection of people in the simulation.
-
-Imports:
-    math
-    initialise_people: Class which handles the initialisation of each person.
-    display: Manages display settings and updates.
-    create_map: Creates and manages the simulation map.
-    tilemap: Creates the tilemap of buildings.
-    disease: Simulates disease probabilities.
-    person: Manages a simulated person's properties and specific methods.
-
-Classes:
-    Population
-"""
-import math
-import initialise_people
-import display # For typing
-import create_map # For typing
-import tilemap # For typing
-import disease # For typing
-import person # For typing
-
-class Population:
-    """
-    A class to manage the population in the simulation.
-
-    Attributes:
-        __display (display.Display): The display object for the simulation.
-        __map (create_map.CreateMap): The map object for the simulation.
-        __tilemap (tilemap.Tilemap): The tilemap object for the map.
-        __num_in_house (int): The number of people per house.
-        __disease (disease.Disease): The disease object for the simulation.
-        __seconds_per_hour (int): The number of seconds per simulation hour.
-        __fps (int): The frames per second for the simulation.
-        __people (list[person.Person]): The list of people in the simulation.
-        __route_intersections (dict[int, list[person.Person]]): The dictionary of route intersections for each person.
-    """
-    def __init__(self, num_in_house: int,
-                 display_obj: display.Display,
-                 map_obj: create_map.CreateMap,
-                 disease_obj: disease.Disease,
-                 seconds_per_hour: int, fps: int) -> None:
-        """
-        Initialises the Population class with the given parameters.
-
-        Args:
-            num_in_house (int): The number of people per house.
-            display_obj (Display): The display object for the simulation.
-            map_obj (Map): The map object for the simulation.
-            disease_obj (Disease): The disease object for the simulation.
-            seconds_per_hour (int): The number of seconds per simulation hour.
-            fps (int): The frames per second for the simulation.
-        """
-        self.__display: display.Display = display_obj
-        self.__map: create_map.CreateMap = map_obj
-        self.__tilemap: tilemap.Tilemap = self.__map.get_tilemap()
-        self.__num_in_house: int = num_in_house
-        self.__disease: disease.Disease = disease_obj
-        self.__seconds_per_hour: int = seconds_per_hour
-        self.__fps: int = fps
-        self.__people: initialise_people.InitialisePeople = initialise_people.InitialisePeople(self.__num_in_house,
-                                                                                               self.__display,
-                                                                                               self.__map,
-                                                                                               self.__disease,
-                                                                                               self.__seconds_per_hour,
-                                                                                               self.__fps).get_people()
-        self.__route_intersections: dict[int, list[person.Person]] = self.__find_route_intersections()
-
-    def draw_people(self) -> None:
-        """
-        Draws all people in the simulation on the display.
-        """
-        for individual in self.__people:
-            individual.draw_person()
-
-    def get_people(self) -> list[person.Person]:
-        """
-        Gets the list of people in the simulation.
-
-        Returns:
-            list[Person]: The list of people in the simulation.
-        """
-        return self.__people
-
-    def move_to_offices(self) -> None:
-        """
-        Starts the movement of all people to their offices.
-        """
-        for individual in self.__people:
-            individual.start_move_to_office()
-
-    def move_to_homes(self) -> None:
-        """
-        Starts the movement of all people to their homes.
-        """
-        for individual in self.__people:
-            individual.start_move_to_home()
-
-    def update_positions(self) -> None:
-        """
-        Updates the positions of all people in the simulation and checks for interactions.
-        """
-        for individual in self.__people:
-            individual.update_position()
-            self.__check_interactions(individual)
-
-    def update_infection_status(self) -> None:
-        """
-        Updates the infection status of all people in the simulation.
-        """
-        self.__check_building_interactions()
-        for individual in self.__people:
-            individual.update_infection_status()
-
-    def has_active_infections(self) -> bool:
-        """
-        Checks if there are any active infections (exposed or infected) in the population.
-
-        Returns:
-            bool: True if there are active infections, False otherwise.
-        """
-        for individual in self.__people:
-            if individual.get_status() in ["E", "I"]:
-                return True
-        return False
-
-    def get_status_counts(self) -> dict[str, int]:
-        """
-        Gets the counts of each infection status in the population.
-
-        Returns:
-            dict[str, int]: A dictionary with the counts of each infection status.
-        """
-        counts: dict[str, int] = {'S': 0, 'E': 0, 'I': 0, 'R': 0, 'D': 0}
-        for individual in self.__people:
-            status = individual.get_status()
-            counts[status] += 1
-        return counts
-
-    def __find_route_intersections(self) -> dict[int, list[person.Person]]:
-        """
-        Finds and returns the route intersections for each person.
-        Optimisation for checking infections of the population.
-
-        Returns:
-            dict[int, list[person.Person]]: The dictionary of route intersections for each person.
-        """
-        intersections: dict[int, list[person.Person]] = {}
-
-        for i, individual in enumerate(self.__people):
-            person_id: int = individual.get_person_id()
-            person_route: set[tuple[int, int]] = set(individual.get_home_to_office_route())
-            intersections[person_id] = [] # Initialise empty list of people with intersections
-            for j, other_person in enumerate(self.__people):
-                if i != j: # Different person
-                    other_person_route: set[tuple[int, int]] = set(other_person.get_home_to_office_route())
-                    if person_route.intersection(other_person_route): # Use intersection operations on sets
-                        intersections[person_id].append(other_person) # Add other person to list of intersections
-
-        return intersections
-
-    def __check_interactions(self, individual: person.Person) -> None:
-        """
-        Checks interactions between the given individual and other individuals at route intersections.
-
-        Args:
-            individual (Person): The individual whose interactions are being checked.
-        """
-        # Check people with intersections, calculate if touching and subject person to probability of getting infected
-        if individual.get_status() == "I":
-            for other in self.__route_intersections[individual.get_person_id()]:
-                if (other.get_status() == "S" and
-                    self.__calculate_distance(individual.get_current_position(),
-                                              other.get_current_position()) <= 2 * individual.get_radius()):
-                    if self.__disease.infect():
-                        other.set_status("E")
-
-    def __check_building_interactions(self) -> None:
-        """
-        Checks interactions between individuals in the same building (home or office).
-        """
-        for individual in self.__people:
-            if individual.get_status() == "I":
-                occupants = []
-                # If individual at home, occupants are people in the house
-                if individual.get_current_position() == individual.get_home_position():
-                    occupants = self.__tilemap.get_home_from_location(individual.get_home_location()).get_occupants()
-                # If individual at office, occupants are people in the office
-                elif individual.get_current_position() == individual.get_office_position():
-                    occupants = self.__tilemap.get_office_from_location(individual.get_office_location()).get_occupants()
-
-                # Chance of those in same building getting infected
-                for occupant in occupants:
-                    if occupant.get_status() == "S" and self.__disease.infect():
-                        occupant.set_status("E")
-
-    def __calculate_distance(self, pos1: tuple[int, int], pos2: tuple[int, int]) -> float:
-        """
-        Calculates the distance between two positions.
-
-        Args:
-            pos1 (tuple[int, int]): The first position.
-            pos2 (tuple[int, int]): The second position.
-
-        Returns:
-            float: The distance between the two positions.
-        """
-        return math.sqrt((pos1[0] - pos2[0]) ** 2 + (pos1[1] - pos2[1]) ** 2)
+"""
+Defines the Population class to manage the collection of people in the simulation.
+
+Imports:
+    collections
+    itertools
+    pygame
+    initialise_people: Class which handles the initialisation of each person.
+    buildings: Manages buildings and their occupants.
+    display: Manages display settings and updates.
+    create_map: Creates and manages the simulation map.
+    tilemap: Creates the tilemap of buildings.
+    disease: Simulates disease probabilities.
+    person: Manages a simulated person's properties and specific methods.
+
+Classes:
+    Population
+"""
+from collections import Counter
+from itertools import combinations
+import pygame # For typing
+import initialise_people
+import buildings # For typing
+import display # For typing
+import create_map # For typing
+import tilemap # For typing
+import disease # For typing
+import person # For typing
+
+class Population:
+    """
+    A class to manage the population in the simulation.
+
+    Attributes:
+        __display (display.Display): The display object for the simulation.
+        __map (create_map.CreateMap): The map object for the simulation.
+        __tilemap (tilemap.Tilemap): The tilemap object for the map.
+        __num_in_house (int): The number of people per house.
+        __disease (disease.Disease): The disease object for the simulation.
+        __seconds_per_hour (int): The number of seconds per simulation hour.
+        __fps (int): The frames per second for the simulation.
+        __people (list[person.Person]): The list of people in the simulation.
+        __route_intersections (dict[int, set[int]]): The indices of the people whose route intersects each person's.
+        __leave_home_buckets (dict[int, list[person.Person]]): People grouped by the hour they leave home.
+        __interaction_cell_size (int): The side length of the spatial grid cells used for interaction checks.
+        __buildings_by_person (dict[int, tuple[buildings.House, buildings.Office]]): Each person's home and
+                                                                                     office buildings, resolved
+                                                                                     once at initialisation.
+        __num_active_infections (int): The number of exposed or infected people at the last status update.
+    """
+    def __init__(self, num_in_house: int,
+                 display_obj: display.Display,
+                 map_obj: create_map.CreateMap,
+                 disease_obj: disease.Disease,
+                 seconds_per_hour: int, fps: int) -> None:
+        """
+        Initialises the Population class with the given parameters.
+
+        Args:
+            num_in_house (int): The number of people per house.
+            display_obj (Display): The display object for the simulation.
+            map_obj (Map): The map object for the simulation.
+            disease_obj (Disease): The disease object for the simulation.
+            seconds_per_hour (int): The number of seconds per simulation hour.
+            fps (int): The frames per second for the simulation.
+        """
+        self.__display: display.Display = display_obj
+        self.__map: create_map.CreateMap = map_obj
+        self.__tilemap: tilemap.Tilemap = self.__map.get_tilemap()
+        self.__num_in_house: int = num_in_house
+        self.__disease: disease.Disease = disease_obj
+        self.__seconds_per_hour: int = seconds_per_hour
+        self.__fps: int = fps
+        self.__people: initialise_people.InitialisePeople = initialise_people.InitialisePeople(self.__num_in_house,
+                                                                                               self.__display,
+                                                                                               self.__map,
+                                                                                               self.__disease,
+                                                                                               self.__seconds_per_hour,
+                                                                                               self.__fps).get_people()
+        self.__route_intersections: dict[int, set[int]] = self.__find_route_intersections()
+        self.__leave_home_buckets: dict[int, list[person.Person]] = self.__find_leave_home_buckets()
+        # Cells at least one contact distance wide, so contacts always lie in the 3x3 neighbourhood
+        self.__interaction_cell_size: int = max((2 * individual.get_maximum_radius()
+                                                 for individual in self.__people), default=1)
+        # Resolve each person's buildings once: the tilemap lookups scan every building per call
+        self.__buildings_by_person: dict[int, tuple[buildings.House, buildings.Office]] = {
+            individual.get_person_id(): (self.__tilemap.get_home_from_location(individual.get_home_location()),
+                                         self.__tilemap.get_office_from_location(individual.get_office_location()))
+            for individual in self.__people}
+        self.__num_active_infections: int = sum(1 for individual in self.__people
+                                                if individual.get_status() in ("E", "I"))
+
+    def draw_people(self) -> None:
+        """
+        Draws all people in the simulation on the display in one batched blit call.
+        """
+        self.__display.get_screen().blits([individual.get_blit() for individual in self.__people],
+                                          doreturn=False)
+
+    def get_drawn_rects(self) -> list[pygame.Rect]:
+        """
+        Gets the screen areas covered by the people the last time they were drawn.
+        Used for dirty-rect rendering: only these areas need restoring and updating per frame.
+
+        Returns:
+            list[pygame.Rect]: The area last drawn for each person that has been drawn.
+        """
+        return [individual.get_drawn_rect() for individual in self.__people
+                if individual.get_drawn_rect() is not None]
+
+    def get_people(self) -> list[person.Person]:
+        """
+        Gets the list of people in the simulation.
+
+        Returns:
+            list[Person]: The list of people in the simulation.
+        """
+        return self.__people
+
+    def get_people_leaving_at(self, hour: int) -> list[person.Person]:
+        """
+        Gets the people who leave home for the office at the given hour.
+
+        Args:
+            hour (int): The simulation hour.
+
+        Returns:
+            list[person.Person]: The people leaving home at that hour.
+        """
+        return self.__leave_home_buckets.get(hour, [])
+
+    def __find_leave_home_buckets(self) -> dict[int, list[person.Person]]:
+        """
+        Groups people by the hour at which they leave home.
+        Optimisation so the hourly update only touches people who actually leave that hour.
+
+        Returns:
+            dict[int, list[person.Person]]: The people grouped by leave-home hour.
+        """
+        buckets: dict[int, list[person.Person]] = {}
+
+        for individual in self.__people:
+            buckets.setdefault(individual.get_leave_home(), []).append(individual)
+
+        return buckets
+
+    def move_to_offices(self) -> None:
+        """
+        Starts the movement of all people to their offices.
+        """
+        for individual in self.__people:
+            individual.start_move_to_office()
+
+    def move_to_homes(self) -> None:
+        """
+        Starts the movement of all people to their homes.
+        """
+        for individual in self.__people:
+            individual.start_move_to_home()
+
+    def update_positions(self) -> None:
+        """
+        Updates the positions of all people in the simulation and checks for interactions.
+
+        People are bucketed into a uniform spatial grid as they move, so each infected
+        person only has to be checked against the people in its neighbouring cells rather
+        than everyone whose route intersects its own.
+        """
+        cell_size: int = self.__interaction_cell_size
+        grid: dict[tuple[int, int], list[int]] = {}
+
+        for i, individual in enumerate(self.__people):
+            individual.update_position()
+            position = individual.get_current_position()
+            grid.setdefault((int(position[0]) // cell_size, int(position[1]) // cell_size), []).append(i)
+
+        for individual in self.__people:
+            if individual.get_status() == "I":
+                self.__check_interactions(individual, grid)
+
+    def update_infection_status(self) -> None:
+        """
+        Updates the infection status of all people in the simulation and recounts
+        the active infections in the same pass.
+        """
+        self.__check_building_interactions()
+        num_active: int = 0
+        for individual in self.__people:
+            individual.update_infection_status()
+            if individual.get_status() in ("E", "I"):
+                num_active += 1
+        self.__num_active_infections = num_active
+
+    def has_active_infections(self) -> bool:
+        """
+        Checks if there are any active infections (exposed or infected) in the population.
+
+        NOTE
+        The counter is maintained by update_infection_status rather than recounted here.
+        Exposures between status updates can only add to a non-zero count (they need an
+        infected person), so the count being zero is always up to date.
+
+        Returns:
+            bool: True if there are active infections, False otherwise.
+        """
+        return self.__num_active_infections > 0
+
+    def get_status_counts(self) -> dict[str, int]:
+        """
+        Gets the counts of each infection status in the population.
+
+        Returns:
+            dict[str, int]: A dictionary with the counts of each infection status.
+        """
+        counts: dict[str, int] = {'S': 0, 'E': 0, 'I': 0, 'R': 0, 'D': 0}
+        # Counter tallies the statuses in C rather than incrementing dict entries in the loop
+        counts.update(Counter(individual.get_status() for individual in self.__people))
+        return counts
+
+    def __find_route_intersections(self) -> dict[int, set[int]]:
+        """
+        Finds and returns the route intersections for each person.
+        Optimisation for checking infections of the population.
+
+        NOTE
+        Two routes intersect exactly when some route point appears on both, so instead of
+        intersecting every pair of routes (quadratic in the population), people are bucketed
+        by the points their route passes through and each bucket yields its pairs directly.
+
+        Returns:
+            dict[int, set[int]]: The indices of the people whose route intersects each person's.
+        """
+        buckets: dict[tuple[int, int], list[int]] = {}
+
+        # Group people by route point; duplicates removed so each pair appears once per shared point
+        for i, individual in enumerate(self.__people):
+            for point in set(individual.get_home_to_office_route()):
+                buckets.setdefault(point, []).append(i)
+
+        intersecting: list[set[int]] = [set() for _ in self.__people]
+
+        # Every pair sharing a bucket shares a route point, i.e. their routes intersect
+        for bucket in buckets.values():
+            for i, j in combinations(bucket, 2):
+                intersecting[i].add(j)
+                intersecting[j].add(i)
+
+        return {individual.get_person_id(): intersecting[i] for i, individual in enumerate(self.__people)}
+
+    def __check_interactions(self, individual: person.Person, grid: dict[tuple[int, int], list[int]]) -> None:
+        """
+        Checks interactions between the given infected individual and the people in its
+        neighbouring grid cells, restricted to those whose routes intersect its own.
+
+        Args:
+            individual (Person): The infected individual whose interactions are being checked.
+            grid (dict[tuple[int, int], list[int]]): People bucketed by spatial grid cell.
+        """
+        intersecting: set[int] = self.__route_intersections[individual.get_person_id()]
+        position: tuple[int, int] = individual.get_current_position()
+        contact_distance_squared: int = individual.get_squared_contact_distance()
+        cell_size: int = self.__interaction_cell_size
+        cell_x: int = int(position[0]) // cell_size
+        cell_y: int = int(position[1]) // cell_size
+
+        # Check people in the surrounding cells, calculate if touching and
+        # subject person to probability of getting infected
+        for grid_x in (cell_x - 1, cell_x, cell_x + 1):
+            for grid_y in (cell_y - 1, cell_y, cell_y + 1):
+                for j in grid.get((grid_x, grid_y), ()):
+                    other = self.__people[j]
+                    if (j in intersecting and other.get_status() == "S" and
+                        self.__squared_distance(position,
+                                                other.get_current_position()) <= contact_distance_squared):
+                        if self.__disease.infect():
+                            other.set_status("E")
+
+    def __check_building_interactions(self) -> None:
+        """
+        Checks interactions between individuals in the same building (home or office).
+        """
+        for individual in self.__people:
+            if individual.get_status() == "I":
+                occupants = []
+                home_building, office_building = self.__buildings_by_person[individual.get_person_id()]
+                # If individual at home, occupants are people in the house
+                if individual.get_current_position() == individual.get_home_position():
+                    occupants = home_building.get_occupants()
+                # If individual at office, occupants are people in the office
+                elif individual.get_current_position() == individual.get_office_position():
+                    occupants = office_building.get_occupants()
+
+                # Chance of those in same building getting infected
+                for occupant in occupants:
+                    if occupant.get_status() == "S" and self.__disease.infect():
+                        occupant.set_status("E")
+
+    def __squared_distance(self, pos1: tuple[int, int], pos2: tuple[int, int]) -> float:
+        """
+        Calculates the squared distance between two positions.
+        Comparing squared distances against a squared threshold avoids a sqrt per pair.
+
+        Args:
+            pos1 (tuple[int, int]): The first position.
+            pos2 (tuple[int, int]): The second position.
+
+        Returns:
+            float: The squared distance between the two positions.
+        """
+        return (pos1[0] - pos2[0]) ** 2 + (pos1[1] - pos2[1]) ** 2
@@ -1,207 +1,212 @@
-"""
-Defines Tilemap class which creates a random tilemap with buildings.
-
-Imports:
-    random
-    numpy
-    pygame
-    buildings: Types of buildings and their properties.
-    display: Holds display properties, pygame modules, to manage display window.
-
-Classes:
-    Tilemap
-"""
-import random
-import numpy as np
-import pygame
-import buildings
-import display # For typing
-
-class Tilemap:
-    """
-    A class to create a tilemap on which different types of buildings can be placed and displayed.
-
-    Attributes:
-        __display (display.Display): Display surface on which the tilemap will be rendered.
-        __building_width (int): The width of the building to be displayed in the tilemap.
-        __building_height (int): The height of the building to be displayed in the tilemap.
-        __size (tuple[int, int]): Number of tiles, depending on display size and building size.
-        __map (np.ndarray): A 2D array representing the tilemap grid, initialised with 0s.
-        __houses (list[buildings.House]): List of House objects in the tilemap.
-        __offices (list[building.Office]): List of Office objects in the tilemap.
-        __buildings (list[buildings.Building]): List of the buildings in the tilemap.
-        __num_houses (int): The number of houses to be placed on the tilemap.
-        __num_offices (int): The number of offices to be placed on the tilemap.
-        __current_houses (int): Current number of houses placed on the tilemap, initialised to 0.
-        __current_offices (int): Current number of offices placed on the tilemap, initialised to 0.
-    """
-    def __init__(self, display_obj: display.Display,
-                 num_houses: int, num_offices: int,
-                 building_width: int, building_height: int) -> None:
-        """
-        Initialises the tilemap with the given parameters.
-
-        Args:
-            display_obj (display.Display): Display surface on which the tilemap will be rendered.
-            num_houses (int): The maximum number of houses that can be placed on the tilemap.
-            num_offices (int): The maximum number of offices that can be placed on the tilemap.
-            building_width (int): The width of each building in the tilemap.
-            building_height (int): The height of each building in the tilemap.
-        """
-        self.__display: display.Display = display_obj
-        self.__building_width: int = building_width
-        self.__building_height: int = building_height
-        self.__size: tuple[int, int] = (int(self.__display.get_width() / building_width),
-                                        int(self.__display.get_height() / building_height))
-        self.__map: np.ndarray = np.zeros(self.__size, dtype=int) # Array of 0s of size self.__size
-        self.__houses: list[buildings.House] = []
-        self.__offices: list[buildings.Office] = []
-        self.__buildings: list[buildings.Building] = []
-        self.__num_houses: int = num_houses
-        self.__num_offices: int = num_offices
-        self.__current_houses: int = 0
-        self.__current_offices: int = 0
-
-    def get_num_houses(self) -> int:
-        """
-        Returns the number of houses to be placed on the tilemap.
-
-        Returns:
-            int: The number of houses to be placed.
-        """
-        return self.__num_houses
-
-    def get_houses(self) -> list[buildings.House]:
-        """
-        Returns the list of houses placed on the tilemap.
-        
-        Returns:
-            list[buildings.House]: The list of houses.
-        """
-        return self.__houses
-
-    def get_offices(self) -> list[buildings.Office]:
-        """
-        Returns the list of offices placed on the tilemap.
-        
-        Returns:
-            list[buildings.Office]: The list of offices.
-        """
-        return self.__offices
-
-    def get_buildings(self) -> list[buildings.Building]:
-        """
-        Returns the list of buildings placed on the tilemap.
-        
-        Returns:
-            list[buildings.Building]: The list of buildings.
-        """
-        return self.__buildings
-
-    def get_home_from_location(self, location: tuple[int, int]) -> buildings.House:
-        """
-        Returns the house object from a coordinate location.
-
-        Returns:
-            buildings.House: The House object with the required location.
-        """
-        for house in self.__houses:
-            if house.get_location() == location:
-                return house
-        return None
-
-    def get_office_from_location(self, location: tuple[int, int]) -> buildings.Office:
-        """
-        Returns the office object from a coordinate location.
-
-        Returns:
-            buildings.Office: The Office object with the required location.
-        """
-        for office in self.__offices:
-            if office.get_location() == location:
-                return office
-        return None
-
-    def get_map(self) -> np.ndarray:
-        """
-        Returns the state of the tilemap as an array.
-        
-        Returns:
-            np.ndarray: A 2D array representing the tilemap.
-        """
-        return self.__map
-
-    def get_building_width(self) -> int:
-        """
-        Returns the width of a building in the tilemap (pixels).
-
-        Returns:
-            int: The building width
-        """
-        return self.__building_width
-
-    def get_building_height(self) -> int:
-        """
-        Returns the height of a building in the tilemap (pixels).
-
-        Returns:
-            int: The building height
-        """
-        return self.__building_height
-
-    def __place_building(self, building_type: str) -> None:
-        """
-        Places a building of the specified type on the tilemap at a random, empty location.
-        If location not empty, random values generated until an empty location is found.
-
-        Args:
-            building_type (str): The type of building to place.
-        """
-        placed: bool = False # Flag set to False
-
-        while not placed:
-            x: int = random.randrange(self.__size[0])
-            y: int = random.randrange(self.__size[1])
-            # NOTE
-            # [x, y] flipped due to differences in coordinate systems in Python/ NumPy and Pygame
-            # Python/ NumPy: first index = row (y), second index = column (x)
-            # Pygame: first index = column (x), second index = row (y)
-            if not self.__map[y, x]: # If building not in x, y location (0 is empty location)
-                if building_type == "house" and self.__current_houses < self.__num_houses:
-                    self.__houses.append(buildings.House((x, y))) # Add to list of houses
-                    self.__buildings.append(buildings.House((x, y))) # Add to list of buildings
-                    self.__map[y, x] = 1
-                    self.__current_houses += 1
-                elif building_type == "office" and self.__current_offices < self. __num_offices:
-                    self.__offices.append(buildings.Office((x, y))) # Add to list of offices
-                    self.__buildings.append(buildings.Office((x, y))) # Add to list of buildings
-                    self.__map[y, x] = 2
-                    self.__current_offices += 1
-
-                placed = True # Set flag to true as building placed
-
-    def render(self, pause: bool) -> None:
-        """
-        Renders all buildings on the display.
-        Draws each building as a rectangle on the display surface using its location and dimensions.
-
-        Args:
-            pause (bool): True if display process to be shown, False if not.
-        """
-        # Loop through number of houses, offices and place on tilemap
-        for building, max_count in [("house", self.__num_houses),
-                                    ("office", self.__num_offices),]:
-            for _ in range(max_count):
-                self.__place_building(building)
-
-        for building in self.__buildings:
-            x, y = building.get_location()
-            pygame.draw.rect(self.__display.get_screen(), # Display surface
-                             building.get_colour(), # Colour
-                             (x * self.__building_width, # Top left coord
-                              y * self.__building_height, # Top right coord
-                              self.__building_width, # Bottom left coord
-                              self.__building_height)) # Bottom right coord
-            if pause:
-                self.__display.update()
-                pygame.time.wait(2) # Wait to show drawing process
+"""
+Defines Tilemap class which creates a random tilemap with buildings.
+
+Imports:
+    numpy
+    pygame
+    buildings: Types of buildings and their properties.
+    display: Holds display properties, pygame modules, to manage display window.
+
+Classes:
+    Tilemap
+"""
+import numpy as np
+import pygame
+import buildings
+import display # For typing
+
+class Tilemap:
+    """
+    A class to create a tilemap on which different types of buildings can be placed and displayed.
+
+    Attributes:
+        __display (display.Display): Display surface on which the tilemap will be rendered.
+        __building_width (int): The width of the building to be displayed in the tilemap.
+        __building_height (int): The height of the building to be displayed in the tilemap.
+        __size (tuple[int, int]): Number of tiles, depending on display size and building size.
+        __map (np.ndarray): A 2D array representing the tilemap grid, initialised with 0s.
+        __houses (list[buildings.House]): List of House objects in the tilemap.
+        __offices (list[building.Office]): List of Office objects in the tilemap.
+        __buildings (list[buildings.Building]): List of the buildings in the tilemap.
+        __house_by_location (dict[tuple[int, int], buildings.House]): Houses indexed by location.
+        __office_by_location (dict[tuple[int, int], buildings.Office]): Offices indexed by location.
+        __num_houses (int): The number of houses to be placed on the tilemap.
+        __num_offices (int): The number of offices to be placed on the tilemap.
+        __current_houses (int): Current number of houses placed on the tilemap, initialised to 0.
+        __current_offices (int): Current number of offices placed on the tilemap, initialised to 0.
+        __rng (np.random.Generator): The random generator used to draw building locations.
+    """
+    def __init__(self, display_obj: display.Display,
+                 num_houses: int, num_offices: int,
+                 building_width: int, building_height: int) -> None:
+        """
+        Initialises the tilemap with the given parameters.
+
+        Args:
+            display_obj (display.Display): Display surface on which the tilemap will be rendered.
+            num_houses (int): The maximum number of houses that can be placed on the tilemap.
+            num_offices (int): The maximum number of offices that can be placed on the tilemap.
+            building_width (int): The width of each building in the tilemap.
+            building_height (int): The height of each building in the tilemap.
+        """
+        self.__display: display.Display = display_obj
+        self.__building_width: int = building_width
+        self.__building_height: int = building_height
+        self.__size: tuple[int, int] = (int(self.__display.get_width() / building_width),
+                                        int(self.__display.get_height() / building_height))
+        # Cell values are only 0/1/2, so uint8 keeps the grid 8x smaller than the default int64.
+        # shape == (rows, cols): the first axis is y to match the [y, x] indexing used below
+        self.__map: np.ndarray = np.zeros((self.__size[1], self.__size[0]), dtype=np.uint8)
+        self.__houses: list[buildings.House] = []
+        self.__offices: list[buildings.Office] = []
+        self.__buildings: list[buildings.Building] = []
+        self.__house_by_location: dict[tuple[int, int], buildings.House] = {}
+        self.__office_by_location: dict[tuple[int, int], buildings.Office] = {}
+        self.__num_houses: int = num_houses
+        self.__num_offices: int = num_offices
+        self.__current_houses: int = 0
+        self.__current_offices: int = 0
+        self.__rng: np.random.Generator = np.random.default_rng()
+
+    def get_num_houses(self) -> int:
+        """
+        Returns the number of houses to be placed on the tilemap.
+
+        Returns:
+            int: The number of houses to be placed.
+        """
+        return self.__num_houses
+
+    def get_houses(self) -> list[buildings.House]:
+        """
+        Returns the list of houses placed on the tilemap.
+        
+        Returns:
+            list[buildings.House]: The list of houses.
+        """
+        return self.__houses
+
+    def get_offices(self) -> list[buildings.Office]:
+        """
+        Returns the list of offices placed on the tilemap.
+        
+        Returns:
+            list[buildings.Office]: The list of offices.
+        """
+        return self.__offices
+
+    def get_buildings(self) -> list[buildings.Building]:
+        """
+        Returns the list of buildings placed on the tilemap.
+        
+        Returns:
+            list[buildings.Building]: The list of buildings.
+        """
+        return self.__buildings
+
+    def get_home_from_location(self, location: tuple[int, int]) -> buildings.House:
+        """
+        Returns the house object from a coordinate location.
+
+        Returns:
+            buildings.House: The House object with the required location.
+        """
+        return self.__house_by_location.get(location)
+
+    def get_office_from_location(self, location: tuple[int, int]) -> buildings.Office:
+        """
+        Returns the office object from a coordinate location.
+
+        Returns:
+            buildings.Office: The Office object with the required location.
+        """
+        return self.__office_by_location.get(location)
+
+    def get_map(self) -> np.ndarray:
+        """
+        Returns the state of the tilemap as an array.
+        
+        Returns:
+            np.ndarray: A 2D array representing the tilemap.
+        """
+        return self.__map
+
+    def get_building_width(self) -> int:
+        """
+        Returns the width of a building in the tilemap (pixels).
+
+        Returns:
+            int: The building width
+        """
+        return self.__building_width
+
+    def get_building_height(self) -> int:
+        """
+        Returns the height of a building in the tilemap (pixels).
+
+        Returns:
+            int: The building height
+        """
+        return self.__building_height
+
+    def __place_all(self) -> None:
+        """
+        Places every house and office on the tilemap at random, empty locations in one pass.
+
+        NOTE
+        Rather than rejection-sampling random coordinates per building (which retries more
+        and more often as the map fills up, and never terminates on a full map), all the
+        needed cells are drawn from the empty ones at once, without replacement.
+        """
+        empty_cells: np.ndarray = np.flatnonzero(self.__map == 0)
+        num_houses: int = min(self.__num_houses, len(empty_cells))
+        num_offices: int = min(self.__num_offices, len(empty_cells) - num_houses)
+        chosen: np.ndarray = self.__rng.choice(empty_cells, num_houses + num_offices, replace=False)
+        # NOTE
+        # [x, y] flipped due to differences in coordinate systems in Python/ NumPy and Pygame
+        # Python/ NumPy: first index = row (y), second index = column (x)
+        # Pygame: first index = column (x), second index = row (y)
+        ys, xs = np.unravel_index(chosen, self.__map.shape)
+
+        house_locations: list[tuple[int, int]] = list(zip(xs[:num_houses].tolist(), ys[:num_houses].tolist()))
+        office_locations: list[tuple[int, int]] = list(zip(xs[num_houses:].tolist(), ys[num_houses:].tolist()))
+
+        new_houses: list[buildings.House] = [buildings.House(location) for location in house_locations]
+        new_offices: list[buildings.Office] = [buildings.Office(location) for location in office_locations]
+
+        self.__houses.extend(new_houses)
+        self.__offices.extend(new_offices)
+        self.__buildings.extend(new_houses) # The combined list shares the same objects
+        self.__buildings.extend(new_offices)
+        self.__house_by_location.update(zip(house_locations, new_houses)) # Index by location for O(1) lookups
+        self.__office_by_location.update(zip(office_locations, new_offices))
+
+        # Mark all the chosen cells in two bulk assignments (1 = house, 2 = office)
+        self.__map[ys[:num_houses], xs[:num_houses]] = 1
+        self.__map[ys[num_houses:], xs[num_houses:]] = 2
+        self.__current_houses += num_houses
+        self.__current_offices += num_offices
+
+    def render(self, pause: bool) -> None:
+        """
+        Renders all buildings on the display.
+        Draws each building as a rectangle on the display surface using its location and dimensions.
+
+        Args:
+            pause (bool): True if display process to be shown, False if not.
+        """
+        self.__place_all() # Place all houses and offices on the tilemap
+
+        screen: pygame.Surface = self.__display.get_screen()
+
+        for building in self.__buildings:
+            x, y = building.get_location()
+            # Surface.fill is pygame's fast solid-rectangle path; cheaper than pygame.draw.rect
+            screen.fill(building.get_colour(), # Colour
+                        (x * self.__building_width, # Left coord
+                         y * self.__building_height, # Top coord
+                         self.__building_width, # Width
+                         self.__building_height)) # Height
+            if pause:
+                self.__display.update()
+                pygame.time.wait(2) # Wait to show drawing process